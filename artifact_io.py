@@ -0,0 +1,104 @@
+"""Модуль для потоковой выгрузки и загрузки артефактов (JSON Lines и бинарный формат)."""
+import json
+import struct
+from typing import BinaryIO, Iterable, Iterator, Tuple
+
+from classes import Artifact
+
+# размер буфера записи и чтения файлов выгрузки
+IO_BUFFER = 1 << 20
+
+# бинарный формат: заголовок, затем записи "<I длина><payload>";
+# payload - байт типа и поля, каждое как "<I длина><utf-8>"
+BINARY_MAGIC = b"ARTF\x01"
+TYPE_FIELDS = {
+    "APHORISM": (1, ("content", "author")),
+    "PROVERB": (2, ("content", "country")),
+}
+CODE_TYPES = {code: (type_name, fields) for type_name, (code, fields) in TYPE_FIELDS.items()}
+
+FORMATS = ("jsonl", "binary")
+
+_LENGTH = struct.Struct("<I")
+
+
+def split_path_format(data: str) -> Tuple[str, str]:
+    """Разбирает аргументы EXPORT/IMPORT вида 'path format'."""
+    parts = data.rsplit(None, 1)
+    if len(parts) != 2:
+        raise ValueError(f"Ожидается 'путь формат', получено '{data}'")
+    path, fmt = parts
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат выгрузки: {fmt}")
+    return path, fmt
+
+
+def write_jsonl(items: Iterable[Artifact], f: BinaryIO) -> int:
+    """Записывает артефакты построчно в JSON Lines, возвращает их число."""
+    count = 0
+    for item in items:
+        f.write(json.dumps(item.to_dict(), ensure_ascii=False).encode("utf-8"))
+        f.write(b"\n")
+        count += 1
+    return count
+
+
+def read_jsonl(f: BinaryIO) -> Iterator[Artifact]:
+    """Читает артефакты из JSON Lines."""
+    for line in f:
+        if line.strip():
+            fields = json.loads(line)
+            if not isinstance(fields, dict):
+                raise ValueError(f"Строка выгрузки не является объектом JSON: {line.strip()!r}")
+            yield Artifact.create(fields.pop("type"), **fields)
+
+
+def write_binary(items: Iterable[Artifact], f: BinaryIO) -> int:
+    """Записывает артефакты в бинарный формат, возвращает их число."""
+    f.write(BINARY_MAGIC)
+    count = 0
+    for item in items:
+        fields = item.to_dict()
+        code, names = TYPE_FIELDS[fields["type"]]
+        payload = bytearray((code,))
+        for name in names:
+            value = fields[name].encode("utf-8")
+            payload += _LENGTH.pack(len(value))
+            payload += value
+        f.write(_LENGTH.pack(len(payload)))
+        f.write(payload)
+        count += 1
+    return count
+
+
+def read_binary(f: BinaryIO) -> Iterator[Artifact]:
+    """Читает артефакты из бинарного формата."""
+    if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+        raise ValueError("Файл не является бинарной выгрузкой артефактов")
+    while True:
+        header = f.read(_LENGTH.size)
+        if not header:
+            return
+        if len(header) != _LENGTH.size:
+            raise ValueError("Бинарная выгрузка обрезана")
+        (size,) = _LENGTH.unpack(header)
+        payload = f.read(size)
+        if size == 0 or len(payload) != size or payload[0] not in CODE_TYPES:
+            raise ValueError("Бинарная выгрузка обрезана")
+        type_name, names = CODE_TYPES[payload[0]]
+        fields = {}
+        pos = 1
+        for name in names:
+            if pos + _LENGTH.size > size:
+                raise ValueError("Бинарная выгрузка обрезана")
+            (length,) = _LENGTH.unpack_from(payload, pos)
+            pos += _LENGTH.size
+            if pos + length > size:
+                raise ValueError("Бинарная выгрузка обрезана")
+            fields[name] = payload[pos:pos + length].decode("utf-8")
+            pos += length
+        yield Artifact.create(type_name, **fields)
+
+
+WRITERS = {"jsonl": write_jsonl, "binary": write_binary}
+READERS = {"jsonl": read_jsonl, "binary": read_binary}
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Бенчмарк: распаковка во временный файл и разбор против потокового чтения."""
+import argparse
+import gzip
+import bz2
+import lzma
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from comand_parser import CommandProcessor
+
+OPENERS = {"gz": gzip.open, "bz2": bz2.open, "xz": lzma.open}
+
+
+def make_archive(path: str, fmt: str, lines: int) -> None:
+    """Создает сжатый файл команд из lines строк ADD."""
+    with OPENERS[fmt](path, "wt", encoding="utf-8") as f:
+        for n in range(lines):
+            if n % 2:
+                f.write(f'ADD PROVERB;content="Пословица номер {n}";country="Россия"\n')
+            else:
+                f.write(f'ADD APHORISM;content="Афоризм номер {n}";author="Автор {n}"\n')
+
+
+def run_decompress_then_parse(path: str, fmt: str) -> float:
+    """Старый путь: распаковка во временный файл, затем execute_file."""
+    start = time.perf_counter()
+    fd, plain = tempfile.mkstemp(suffix=".txt")
+    os.close(fd)
+    try:
+        with OPENERS[fmt](path, "rb") as src, open(plain, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        with redirect_stdout(StringIO()):
+            CommandProcessor().execute_file(plain)
+    finally:
+        os.unlink(plain)
+    return time.perf_counter() - start
+
+
+def run_streaming(path: str) -> float:
+    """Новый путь: execute_file читает архив напрямую."""
+    start = time.perf_counter()
+    with redirect_stdout(StringIO()):
+        CommandProcessor().execute_file(path)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for fmt in OPENERS:
+            path = os.path.join(tmpdir, f"commands.txt.{fmt}")
+            make_archive(path, fmt, args.lines)
+            old = min(run_decompress_then_parse(path, fmt) for _ in range(args.repeat))
+            new = min(run_streaming(path) for _ in range(args.repeat))
+            print(f"{fmt:>4}: распаковка+разбор {old:.3f} c, поток {new:.3f} c, "
+                  f"ускорение x{old / new:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Бенчмарк: параллельный поиск REM в MemoryStorage в зависимости от числа потоков."""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from classes import Aphorism, Proverb
+from storage import MemoryStorage, gil_enabled
+
+
+def build_storage(size: int, workers: int) -> MemoryStorage:
+    """Создает хранилище из size артефактов с принудительным параллельным поиском."""
+    storage = MemoryStorage(workers=workers, parallel=workers > 1, parallel_threshold=0)
+    storage.add_many(
+        Proverb(f"Без труда не выловишь и рыбку из пруда {n}", "Россия") if n % 3 == 0
+        else Aphorism(f"Афоризм номер {n}", f"Автор {n % 100}")
+        for n in range(size)
+    )
+    return storage
+
+
+def measure(storage: MemoryStorage, repeat: int) -> float:
+    """Лучшее время поиска REM content~"рыбку" из repeat попыток."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        storage.find_ids("content", "рыбку")
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    print(f"GIL включен: {gil_enabled()}, процессоров: {os.cpu_count()}")
+    baseline = None
+    for workers in args.workers:
+        storage = build_storage(args.size, workers)
+        elapsed = measure(storage, args.repeat)
+        storage.close()
+        baseline = baseline or elapsed
+        print(f"потоков {workers:>2}: {elapsed:.3f} c, ускорение x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Бенчмарк: REM attr~/pattern/ против нескольких REM с подстрокой."""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from classes import Aphorism, Proverb
+from repository import Repository
+
+# (регулярное выражение, эквивалентный набор подстрок)
+CASES = (
+    (r"номер 12\d", [f"номер 12{d}" for d in range(10)]),
+    (r"рыбку|пруда", ["рыбку", "пруда"]),
+)
+
+
+def build_repo(size: int) -> Repository:
+    """Создает репозиторий из size артефактов."""
+    repo = Repository(spill_threshold=None)
+    repo.add_many(
+        Proverb(f"Без труда не выловишь и рыбку из пруда, номер {n}", "Россия") if n % 50 == 0
+        else Aphorism(f"Афоризм номер {n}", f"Автор {n % 100}")
+        for n in range(size)
+    )
+    return repo
+
+
+def run_multipass(size: int, values) -> tuple:
+    repo = build_repo(size)
+    start = time.perf_counter()
+    for value in values:
+        repo.remove_by_condition("content", value)
+    return time.perf_counter() - start, len(repo.items)
+
+
+def run_regex(size: int, pattern: str) -> tuple:
+    repo = build_repo(size)
+    start = time.perf_counter()
+    repo.remove_by_pattern("content", pattern)
+    return time.perf_counter() - start, len(repo.items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200_000)
+    args = parser.parse_args()
+
+    for pattern, values in CASES:
+        multi_time, multi_left = run_multipass(args.size, values)
+        regex_time, regex_left = run_regex(args.size, pattern)
+        assert multi_left == regex_left, (multi_left, regex_left)
+        print(f"/{pattern}/: {len(values)} REM с подстрокой {multi_time:.3f} c, "
+              f"regex {regex_time:.3f} c, ускорение x{multi_time / regex_time:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,28 @@
 """Модуль с классами артефактов (афоризмы и пословицы)."""
+import unicodedata
 from abc import ABC, abstractmethod
 
+# атрибуты, для которых считаются нормализованные ключи (REM attr~i"...")
+NORMALIZED_ATTRS = ("content", "author", "country")
+
+
+def normalize_key(text: str) -> str:
+    """Приводит строку к виду для сравнения без учета регистра (NFKC + casefold)."""
+    return unicodedata.normalize("NFKC", text).casefold()
+
 class Artifact(ABC):
     """Абстрактный базовый класс для всех артефактов."""
     def __init__(self, content: str):
         self.content = content
+        #нормализованные копии атрибутов, заполняет Repository.add (или None)
+        self._normalized = None
+
+    def build_normalized(self):
+        """Считает нормализованные копии content/author/country один раз."""
+        self._normalized = {
+            attr: normalize_key(str(getattr(self, attr)))
+            for attr in NORMALIZED_ATTRS if hasattr(self, attr)
+        }
 
     @staticmethod
     def create(type_name: str, **kwargs):
@@ -26,6 +44,44 @@ class Artifact(ABC):
     def matches_condition(self, attr, value):
         """Проверка условия для REM"""
 
+    #метод который обязан релизовать класс наследник для EXPORT
+    @abstractmethod
+    def to_dict(self):
+        """Возвращает поля объекта вместе с типом в виде словаря."""
+
+    def normalized_value(self, attr):
+        """Нормализованное значение атрибута или None, если атрибута нет.
+
+        Если нормализованные копии не сохранены, значение считается заново.
+        """
+        if self._normalized is not None:
+            return self._normalized.get(attr)
+        if attr not in NORMALIZED_ATTRS or not hasattr(self, attr):
+            return None
+        return normalize_key(str(getattr(self, attr)))
+
+    def matches_ignore_case(self, attr, key):
+        """Проверка условия REM attr~i"value" без учета регистра.
+
+        key - уже нормализованное значение.
+        """
+        text = self.normalized_value(attr)
+        return text is not None and key in text
+
+    def matches_pattern(self, attr, regex, literals=()):
+        """Проверка условия REM attr~/pattern/.
+
+        literals - подстроки, обязательные для совпадения: дешевая проверка
+        `in` отбрасывает большинство объектов до запуска регулярного выражения.
+        """
+        if not hasattr(self, attr):
+            return False
+        text = str(getattr(self, attr))
+        for literal in literals:
+            if literal not in text:
+                return False
+        return regex.search(text) is not None
+
     #для преобразования контента объекта в строку
     def __str__(self):
         return f"[{self.type_name()}] content=\"{self.content}\""
@@ -46,6 +102,9 @@ class Aphorism(Artifact):
             return value in str(getattr(self, attr))
         return False
 
+    def to_dict(self):
+        return {"type": "APHORISM", "content": self.content, "author": self.author}
+
     def __str__(self):
         return f"[APHORISM] content=\"{self.content}\" author=\"{self.author}\""
 
@@ -65,5 +124,8 @@ class Proverb(Artifact):
             return value in str(getattr(self, attr))
         return False
 
+    def to_dict(self):
+        return {"type": "PROVERB", "content": self.content, "country": self.country}
+
     def __str__(self):
         return f"[PROVERB] content=\"{self.content}\" country=\"{self.country}\""
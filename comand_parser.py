@@ -1,14 +1,40 @@
 """Модуль для парсинга команд из файла и их выполнения."""
+import json
+import os
+import time
+from typing import List, Optional
+from artifact_io import READERS, split_path_format
 from classes import Artifact
+from memstats import format_report
+from command_io import READ_BUFFER, open_commands
 from repository import Repository
 
 
+def parse_args(arg_string: str):
+    """Парсит строку аргументов вида key="value";key2="value2" в словарь."""
+    result = {}
+    parts = arg_string.split(";")
+    for part in parts:
+        if "=" in part:
+            key, val = part.split("=", 1)
+            #убираем пробелы и кавычки
+            result[key.strip()] = val.strip().strip("\"")
+    return result
+
+
 class CommandProcessor:
-    """Класс для обработки команд из файла (ADD, REM, PRINT)."""
+    """Класс для обработки команд из файла (ADD, REM, PRINT и др.)."""
     def __init__(self):
         #создаем компазицию, когда CP будет внутри содержать Repo
         self.repo = Repository()
-
+        #артефакты открытой транзакции (None - транзакции нет)
+        self.batch: Optional[List[Artifact]] = None
+        self.batch_failed = False
+        #состояние режима follow: до какого байта и в каком файле (inode) применены команды
+        self.follow_offset = 0
+        self.follow_inode: Optional[int] = None
+        #байт, с которого начинается BEGIN открытой транзакции (None - транзакции нет)
+        self.follow_begin_offset: Optional[int] = None
 
     def process_line(self, line: str) -> None:
         """Обрабатывает строку команды."""
@@ -31,19 +57,65 @@ class CommandProcessor:
         # PRINT - просто вызываем сразу метод вывода из репозитория
         if line == "PRINT":
             return self.repo.print_all()
-            
-        print("Недопустимая команда в файле:", line)
+
+        # MEMSTATS или MEMSTATS <размер выборки>
+        if line.startswith("MEMSTATS"):
+            return self.process_memstats(line[8:].strip())
+
+        # EXPORT path format / IMPORT path format
+        if line.startswith("EXPORT"):
+            return self.process_export(line[7:].strip())
+        if line.startswith("IMPORT"):
+            return self.process_import(line[7:].strip())
+
+        # транзакции: ADD между BEGIN и COMMIT применяются одной пачкой
+        if line == "BEGIN":
+            return self.process_begin()
+        if line == "COMMIT":
+            return self.process_commit()
+        if line == "ROLLBACK":
+            return self.process_rollback()
+
+        self.report_error("Недопустимая команда в файле:", line)
+
+    def report_error(self, *message) -> None:
+        """Выводит сообщение об ошибке; ошибка внутри транзакции ее проваливает."""
+        print(*message)
+        if self.batch is not None:
+            self.batch_failed = True
+
+    def process_begin(self) -> None:
+        """Открывает транзакцию."""
+        if self.batch is not None:
+            self.report_error("Ошибка: транзакция уже открыта")
+            return
+        self.batch = []
+        self.batch_failed = False
+
+    def process_commit(self) -> None:
+        """Применяет артефакты транзакции одним вызовом add_many."""
+        if self.batch is None:
+            print("Ошибка: COMMIT без BEGIN")
+            return
+        batch, failed = self.batch, self.batch_failed
+        self.batch = None
+        self.batch_failed = False
+        if failed:
+            print(f"Транзакция отменена из-за ошибок, не добавлено: {len(batch)}")
+            return
+        self.repo.add_many(batch)
+
+    def process_rollback(self) -> None:
+        """Отменяет транзакцию, репозиторий не меняется."""
+        if self.batch is None:
+            print("Ошибка: ROLLBACK без BEGIN")
+            return
+        self.batch = None
+        self.batch_failed = False
 
     def parse_args(self, arg_string: str):
         """Парсит строку аргументов вида key="value";key2="value2" в словарь."""
-        result = {}
-        parts = arg_string.split(";")
-        for part in parts:
-            if "=" in part:
-                key, val = part.split("=", 1)
-                #убираем пробелы и кавычки
-                result[key.strip()] = val.strip().strip("\"")
-        return result
+        return parse_args(arg_string)
 
     #смотрим на тип команды, создаем на ее основе объект класса.
     def process_add(self, data: str):
@@ -52,7 +124,7 @@ class CommandProcessor:
         #на два, тип фразы отпраляем в type_name
         #аргументы цельной строкой отправляем в args
         if ";" not in data:
-            print(f"Ошибка в команде ADD: отсутствует точка с запятой в '{data}'")
+            self.report_error(f"Ошибка в команде ADD: отсутствует точка с запятой в '{data}'")
             return
             
         type_name, args = data.split(";", 1)
@@ -62,34 +134,170 @@ class CommandProcessor:
 
         try:
             obj = Artifact.create(type_name, **args)
-            self.repo.add(obj)
         except KeyError as e:
-            print(f"Ошибка: отсутствует обязательный параметр {e} для типа {type_name}")
+            self.report_error(f"Ошибка: отсутствует обязательный параметр {e} для типа {type_name}")
+            return
         except ValueError as e:
-            print(e)
+            self.report_error(e)
+            return
+
+        if self.batch is not None:
+            self.batch.append(obj)
+        else:
+            self.repo.add(obj)
 
     #делим строку на аттрибут и значение, очищаем от пробелов и кавычек
     #значение, вызываем remove_by_condition
     def process_rem(self, data: str):
         """Обрабатывает команду REM, удаляя объекты из репозитория по условию."""
-        # пример: content~"abc"
+        # пример: content~"abc", content~i"без учета регистра"
+        # или content~/регулярное выражение/
         if "~" not in data:
-            print(f"Ошибка в команде REM: отсутствует символ '~' в '{data}'")
+            self.report_error(f"Ошибка в команде REM: отсутствует символ '~' в '{data}'")
             return
-            
+
+        #удаление не буферизуется, поэтому внутри транзакции запрещено
+        if self.batch is not None:
+            self.report_error(f"Ошибка: REM внутри транзакции не поддерживается: '{data}'")
+            return
+
         try:
             attr, value = data.split("~", 1)
-            value = value.strip().strip("\"")
-            self.repo.remove_by_condition(attr, value)
+            value = value.strip()
+            if len(value) >= 2 and value.startswith("/") and value.endswith("/"):
+                self.repo.remove_by_pattern(attr, value[1:-1])
+                return
+            ignore_case = value.startswith("i\"")
+            if ignore_case:
+                value = value[1:]
+            value = value.strip("\"")
+            self.repo.remove_by_condition(attr, value, ignore_case)
         except Exception as e:
-            print(f"Ошибка при обработке команды REM '{data}': {e}")
+            self.report_error(f"Ошибка при обработке команды REM '{data}': {e}")
+
+    def process_memstats(self, data: str) -> None:
+        """Обрабатывает команду MEMSTATS, выводя отчет о памяти репозитория."""
+        if data and not data.isdigit():
+            self.report_error(f"Ошибка в команде MEMSTATS: размер выборки '{data}' не число")
+            return
+        print(format_report(self.repo.memory_report(int(data) if data else None)))
+
+    def process_export(self, data: str) -> None:
+        """Обрабатывает команду EXPORT, выгружая репозиторий в файл."""
+        try:
+            path, fmt = split_path_format(data)
+            self.repo.export(path, fmt)
+        except (ValueError, OSError) as e:
+            self.report_error(f"Ошибка в команде EXPORT: {e}")
+
+    def process_import(self, data: str) -> None:
+        """Обрабатывает команду IMPORT, загружая артефакты из выгрузки."""
+        try:
+            path, fmt = split_path_format(data)
+            if self.batch is not None:
+                with open(path, "rb") as f:
+                    self.batch.extend(READERS[fmt](f))
+            else:
+                self.repo.import_file(path, fmt)
+        except (ValueError, KeyError, OSError) as e:
+            self.report_error(f"Ошибка в команде IMPORT: {e}")
+
+    def close(self) -> None:
+        """Закрывает репозиторий (удаляет временную базу SQLite после переноса)."""
+        self.repo.close()
 
     def execute_file(self, filename: str) -> None:
-        """Читает команды из файла и выполняет их."""
+        """Читает команды из файла (в том числе .gz/.bz2/.xz) и выполняет их."""
         try:
-            with open(filename, "r", encoding="utf-8") as f:
+            with open_commands(filename) as f:
                 for line in f:
                     self.process_line(line)
+            if self.batch is not None:
+                print("Файл закончился без COMMIT, транзакция отменена")
+                self.process_rollback()
         except FileNotFoundError:
             print(f"Файл {filename} не найден")
-            raise
\ No newline at end of file
+            raise
+
+    def follow(self, filename: str, poll_interval: float = 1.0,
+               offset_file: Optional[str] = None, max_polls: Optional[int] = None) -> None:
+        """Следит за дописываемым файлом и выполняет только новые строки.
+
+        Файл опрашивается раз в poll_interval секунд; max_polls ограничивает
+        число опросов (None - бесконечно).
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            self.follow_once(filename, offset_file)
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(poll_interval)
+
+    def follow_once(self, filename: str, offset_file: Optional[str] = None) -> int:
+        """Выполняет строки, дописанные с прошлого вызова; возвращает их число.
+
+        Незавершенная последняя строка (без перевода строки) ждет следующего
+        опроса. Если файл укоротился или был заменен (другой inode), чтение
+        начинается с начала. Если задан offset_file, позиция сохраняется в нем,
+        и после перезапуска уже выполненные строки не повторяются. Пока
+        транзакция открыта, сохраняется позиция ее BEGIN: незакоммиченные ADD
+        живут только в памяти и после перезапуска должны выполниться заново.
+        """
+        if offset_file is not None and self.follow_inode is None:
+            self._load_follow_offset(offset_file)
+
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            #файл мог быть переименован при ротации, новый еще не создан
+            return 0
+        if self.follow_inode is not None and stat.st_ino != self.follow_inode:
+            self.follow_offset = 0
+        if stat.st_size < self.follow_offset:
+            self.follow_offset = 0
+        self.follow_inode = stat.st_ino
+
+        processed = 0
+        with open(filename, "rb") as f:
+            f.seek(self.follow_offset)
+            tail = b""
+            while True:
+                block = f.read(READ_BUFFER)
+                if not block:
+                    break
+                data = tail + block
+                end = data.rfind(b"\n") + 1
+                tail = data[end:]
+                line_start = self.follow_offset
+                for line in data[:end].split(b"\n")[:-1]:
+                    self.process_line(line.decode("utf-8"))
+                    if self.batch is None:
+                        self.follow_begin_offset = None
+                    elif self.follow_begin_offset is None:
+                        self.follow_begin_offset = line_start
+                    line_start += len(line) + 1
+                    processed += 1
+                self.follow_offset += end
+
+        if offset_file is not None:
+            self._save_follow_offset(offset_file)
+        return processed
+
+    def _load_follow_offset(self, offset_file: str) -> None:
+        """Загружает сохраненную позицию режима follow."""
+        if not os.path.exists(offset_file):
+            return
+        with open(offset_file, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        self.follow_inode = state["inode"]
+        self.follow_offset = state["offset"]
+
+    def _save_follow_offset(self, offset_file: str) -> None:
+        """Атомарно сохраняет позицию режима follow."""
+        offset = self.follow_offset
+        if self.follow_begin_offset is not None:
+            offset = self.follow_begin_offset
+        tmp_name = offset_file + ".tmp"
+        with open(tmp_name, "w", encoding="utf-8") as f:
+            json.dump({"inode": self.follow_inode, "offset": offset}, f)
+        os.replace(tmp_name, offset_file)
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""Модуль для открытия файлов команд, в том числе сжатых (gzip, bz2, xz)."""
+import bz2
+import gzip
+import io
+import lzma
+from typing import TextIO
+
+# размер буфера чтения - сжатые архивы читаются крупными блоками
+READ_BUFFER = 1 << 20
+
+# сигнатуры форматов сжатия и функции открытия
+MAGIC_OPENERS = (
+    (b"\x1f\x8b", gzip.open),
+    (b"BZh", bz2.open),
+    (b"\xfd7zXZ\x00", lzma.open),
+)
+
+
+def detect_opener(filename: str):
+    """Определяет формат сжатия по сигнатуре.
+
+    Возвращает функцию открытия или None для несжатого файла. Расширение
+    не учитывается: сжатые файлы всегда начинаются с сигнатуры, а текстовый
+    файл с именем *.gz должен читаться как обычный.
+    """
+    with open(filename, "rb") as f:
+        head = f.read(6)
+    for magic, opener in MAGIC_OPENERS:
+        if head.startswith(magic):
+            return opener
+    return None
+
+
+def open_commands(filename: str) -> TextIO:
+    """Открывает файл команд на чтение как текст, распаковывая его на лету."""
+    opener = detect_opener(filename)
+    if opener is None:
+        return open(filename, "r", encoding="utf-8", buffering=READ_BUFFER)
+    stream = io.BufferedReader(opener(filename, "rb"), buffer_size=READ_BUFFER)
+    return io.TextIOWrapper(stream, encoding="utf-8")
@@ -1,10 +1,38 @@
 """Точка входа в программу. Запускает обработку файла с командами."""
+import argparse
+import sys
+
 from comand_parser import CommandProcessor
+from validator import check_file_json
 
-def main():
+def main(argv=None):
     """Главная функция для запуска программы."""
+    parser = argparse.ArgumentParser(description="Обработка файла с командами")
+    parser.add_argument("filename", nargs="?", default="artifact.txt")
+    parser.add_argument("--check", action="store_true",
+                        help="только проверить файл и вывести ошибки в JSON")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--follow", action="store_true",
+                        help="следить за дописываемым файлом и выполнять новые строки")
+    parser.add_argument("--offset-file", default=None,
+                        help="файл для сохранения позиции в режиме --follow")
+    parser.add_argument("--poll-interval", type=float, default=1.0)
+    args = parser.parse_args([] if argv is None else argv)
+
+    if args.check:
+        report = check_file_json(args.filename, args.workers)
+        print(report)
+        return 1 if report != "[]" else 0
+
     cp = CommandProcessor()
-    cp.execute_file("artifact.txt")
+    try:
+        if args.follow:
+            cp.follow(args.filename, args.poll_interval, args.offset_file)
+        else:
+            cp.execute_file(args.filename)
+    finally:
+        cp.close()
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main(sys.argv[1:]))
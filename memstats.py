@@ -0,0 +1,98 @@
+"""Модуль для оценки памяти, занимаемой артефактами (команда MEMSTATS)."""
+import sys
+import tracemalloc
+from typing import Dict, List
+
+from classes import Artifact
+
+# сколько мест выделения памяти показывать из tracemalloc
+TOP_ALLOCATIONS = 10
+
+
+def _deep_size(value) -> int:
+    """Размер значения атрибута вместе с содержимым словаря (нормализованные ключи)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+    return size
+
+
+def memory_report(counts: Dict[str, int], sampled: List[Artifact],
+                  container_bytes: int = 0) -> Dict:
+    """Считает память артефактов по типам и атрибутам.
+
+    counts - число артефактов каждого типа, sampled - измеряемые объекты
+    (все или случайная выборка). Размеры по выборке умножаются на долю
+    выборки внутри типа, поэтому стоимость отчета ограничена ее размером.
+    """
+
+    types: Dict[str, Dict] = {}
+    string_refs = 0
+    unique_strings = set()
+    for item in sampled:
+        stats = types.setdefault(item.type_name(), {
+            "sampled": 0, "object_bytes": 0, "attributes": {}
+        })
+        stats["sampled"] += 1
+        stats["object_bytes"] += sys.getsizeof(item) + sys.getsizeof(item.__dict__)
+        for name, value in vars(item).items():
+            attrs = stats["attributes"]
+            attrs[name] = attrs.get(name, 0) + _deep_size(value)
+            if isinstance(value, str):
+                string_refs += 1
+                unique_strings.add(id(value))
+
+    #типы, не попавшие в выборку, показываем с количеством, но без размеров
+    for type_name in counts:
+        types.setdefault(type_name, {"sampled": 0, "object_bytes": 0, "attributes": {}})
+
+    total = 0
+    for type_name, stats in types.items():
+        stats["count"] = counts[type_name]
+        scale = stats["count"] / stats["sampled"] if stats["sampled"] else 0
+        stats["object_bytes"] = int(stats["object_bytes"] * scale)
+        stats["attributes"] = {
+            name: int(size * scale) for name, size in stats["attributes"].items()
+        }
+        stats["deep_bytes"] = stats["object_bytes"] + sum(stats["attributes"].values())
+        total += stats["deep_bytes"]
+
+    return {
+        "count": sum(counts.values()),
+        "sampled": len(sampled),
+        "types": types,
+        "deep_bytes": total,
+        #доля ссылок на строки, которые указывают на уже встреченный объект str
+        "string_sharing": 1 - len(unique_strings) / string_refs if string_refs else 0.0,
+        "container_bytes": container_bytes,
+        "top_allocations": top_allocations(),
+    }
+
+
+def top_allocations(limit: int = TOP_ALLOCATIONS) -> List[Dict]:
+    """Возвращает крупнейшие места выделения памяти, если tracemalloc включен."""
+    if not tracemalloc.is_tracing():
+        return []
+    stats = tracemalloc.take_snapshot().statistics("lineno")[:limit]
+    return [
+        {"site": str(stat.traceback[0]), "bytes": stat.size, "blocks": stat.count}
+        for stat in stats
+    ]
+
+
+def format_report(report: Dict) -> str:
+    """Форматирует отчет о памяти для вывода командой MEMSTATS."""
+    lines = [
+        f"Артефактов: {report['count']} (в выборке {report['sampled']}), "
+        f"всего байт: {report['deep_bytes']}, контейнер: {report['container_bytes']}, "
+        f"доля общих строк: {report['string_sharing']:.2%}"
+    ]
+    for type_name, stats in sorted(report["types"].items()):
+        attrs = ", ".join(f"{name}={size}" for name, size in sorted(stats["attributes"].items()))
+        lines.append(
+            f"[{type_name}] count={stats['count']} bytes={stats['deep_bytes']} "
+            f"object={stats['object_bytes']} {attrs}"
+        )
+    for alloc in report["top_allocations"]:
+        lines.append(f"  {alloc['site']}: {alloc['bytes']} байт в {alloc['blocks']} блоках")
+    return "\n".join(lines)
@@ -0,0 +1,63 @@
+"""Модуль с кэшем регулярных выражений для REM attr~/pattern/."""
+import re
+from functools import lru_cache
+from typing import List, Pattern, Tuple
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse  # pylint: disable=deprecated-module
+
+# сколько скомпилированных шаблонов хранится в кэше
+PATTERN_CACHE_SIZE = 128
+
+_LITERAL = sre_parse.LITERAL
+_SUBPATTERN = sre_parse.SUBPATTERN
+_MAX_REPEAT = sre_parse.MAX_REPEAT
+_MIN_REPEAT = sre_parse.MIN_REPEAT
+_AT = sre_parse.AT
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str) -> Pattern:
+    """Компилирует шаблон (результат кэшируется)."""
+    return re.compile(pattern)
+
+
+@lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def required_literals(pattern: str) -> Tuple[str, ...]:
+    """Возвращает подстроки, которые есть в любом совпадении с шаблоном.
+
+    Если хотя бы одной из них нет в строке, регулярное выражение можно
+    не запускать. Подстроки отсортированы от длинной к короткой.
+    """
+    parsed = sre_parse.parse(pattern)
+    if parsed.state.flags & re.IGNORECASE:
+        return ()
+    runs: List[str] = []
+    _collect(list(parsed), runs)
+    runs = [run for run in dict.fromkeys(runs) if run]
+    return tuple(sorted(runs, key=len, reverse=True))
+
+
+def _collect(items, runs: List[str]) -> None:
+    """Собирает в runs цепочки литералов из обязательной части шаблона."""
+    current = []
+    for op, arg in items:
+        if op is _LITERAL:
+            current.append(chr(arg))
+            continue
+        if op is _AT:
+            #якоря ^ и $ не занимают символов и не рвут цепочку
+            continue
+        runs.append("".join(current))
+        current = []
+        if op is _SUBPATTERN:
+            _, add_flags, _, body = arg
+            if not add_flags & re.IGNORECASE:
+                _collect(list(body), runs)
+        elif op in (_MAX_REPEAT, _MIN_REPEAT):
+            low, _, body = arg
+            if low >= 1:
+                _collect(list(body), runs)
+    runs.append("".join(current))
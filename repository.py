@@ -1,25 +1,183 @@
 """Модуль для хранения и управления коллекцией артефактов."""
-from typing import List
-from classes import Artifact
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from itertools import islice
+from artifact_io import IO_BUFFER, READERS, WRITERS
+from classes import Artifact, normalize_key
+from memstats import memory_report
+from patterns import compile_pattern, required_literals
+from storage import MemoryStorage, SQLiteStorage, Storage
+
+# после скольких артефактов репозиторий переезжает из памяти в SQLite
+SPILL_THRESHOLD = 1_000_000
+# сколько запросов attr~value помнит кэш результатов
+QUERY_CACHE_SIZE = 256
+# сколько артефактов IMPORT добавляет за один вызов add_many
+IMPORT_CHUNK = 10_000
+
+def _matches(item: Artifact, attr: str, value: str, ignore_case: bool) -> bool:
+    """Проверяет артефакт на условие из ключа кэша результатов."""
+    if ignore_case:
+        return item.matches_ignore_case(attr, value)
+    return item.matches_condition(attr, value)
+
 
 class Repository:
     """Класс-контейнер для хранения и управления артефактами."""
-    def __init__(self):
-        """Инициализирует пустой репозиторий."""
-        self.items: List[Artifact] = []
+    def __init__(self, storage: Optional[Storage] = None,
+                 spill_threshold: Optional[int] = SPILL_THRESHOLD,
+                 cache_size: int = QUERY_CACHE_SIZE,
+                 store_normalized_keys: bool = True):
+        """Инициализирует пустой репозиторий.
+
+        По умолчанию артефакты хранятся в памяти; когда их становится больше
+        spill_threshold, они переносятся в SQLiteStorage на диске.
+        spill_threshold=None отключает перенос.
+        cache_size задаёт размер LRU-кэша результатов поиска (0 отключает кэш).
+        store_normalized_keys: хранить ли нормализованные копии атрибутов для
+        REM attr~i"value" (быстрее, но больше памяти) или считать их при сравнении;
+        после переноса в SQLite опция передается SQLiteStorage.
+        """
+        self.storage: Storage = storage if storage is not None else MemoryStorage()
+        self.spill_threshold = spill_threshold
+        #поколение растёт при каждом удалении, старые записи кэша считаются промахом;
+        #добавления кэш не сбрасывают - идентификаторы в хранилище только растут
+        self.generation = 0
+        self.cache_size = cache_size
+        self.store_normalized_keys = store_normalized_keys
+        self.cache_hits = 0
+        self.cache_misses = 0
+        #запись кэша: (поколение, найденные id, последний id хранилища на момент поиска)
+        self._query_cache: "OrderedDict[Tuple[str, str, bool], Tuple[int, List[int], int]]" = \
+            OrderedDict()
+
+    @property
+    def items(self) -> List[Artifact]:
+        """Список артефактов в порядке добавления."""
+        return list(self.storage)
 
     def add(self, item: Artifact) -> None:
         """Добавляет артефакт в репозиторий."""
-        self.items.append(item)
+        if self.store_normalized_keys:
+            item.build_normalized()
+        #кэш не трогаем: новые артефакты досматриваются при следующем попадании
+        self.storage.add(item)
+        self._maybe_spill()
+
+    def add_many(self, items: Iterable[Artifact]) -> None:
+        """Добавляет пачку артефактов одним обращением к хранилищу."""
+        items = list(items)
+        if not items:
+            return
+        if self.store_normalized_keys:
+            for item in items:
+                item.build_normalized()
+        self.storage.add_many(items)
+        self._maybe_spill()
+
+    def find_ids(self, attr: str, value: str, ignore_case: bool = False) -> List[int]:
+        """Возвращает идентификаторы артефактов, подходящих под attr~value.
+
+        При ignore_case сравнение идет без учета регистра (NFKC + casefold).
+        """
+        if ignore_case:
+            value = normalize_key(value)
+        key = (attr, value, ignore_case)
+        last_id = self.storage.last_id()
+        cached = self._query_cache.get(key)
+        if cached is not None and cached[0] == self.generation:
+            self.cache_hits += 1
+            _, ids, seen_id = cached
+            if seen_id < last_id:
+                #с последнего поиска добавлялись артефакты - проверяем только их
+                ids.extend(
+                    item_id for item_id, item in self.storage.items_after(seen_id)
+                    if _matches(item, attr, value, ignore_case)
+                )
+                self._query_cache[key] = (self.generation, ids, last_id)
+            self._query_cache.move_to_end(key)
+            return list(ids)
+
+        self.cache_misses += 1
+        ids = self.storage.find_ids(attr, value, ignore_case)
+        if self.cache_size > 0:
+            self._query_cache[key] = (self.generation, list(ids), last_id)
+            self._query_cache.move_to_end(key)
+            if len(self._query_cache) > self.cache_size:
+                self._query_cache.popitem(last=False)
+        return ids
 
-    def remove_by_condition(self, attr: str, value: str) -> None:
+    def remove_by_condition(self, attr: str, value: str, ignore_case: bool = False) -> None:
         """Удаляет артефакты, которые соответствуют условию attr~value."""
-        self.items = [
-            i for i in self.items
-            if not i.matches_condition(attr, value)
-        ]
+        ids = self.find_ids(attr, value, ignore_case)
+        if ids:
+            self.storage.remove_ids(ids)
+            self._invalidate()
+
+    def remove_by_pattern(self, attr: str, pattern: str) -> None:
+        """Удаляет артефакты, у которых attr совпадает с регулярным выражением."""
+        ids = self.storage.find_ids_by_pattern(
+            attr, compile_pattern(pattern), required_literals(pattern)
+        )
+        if ids:
+            self.storage.remove_ids(ids)
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Делает устаревшими все записи кэша результатов."""
+        self.generation += 1
+        self._query_cache.clear()
+
+    def cache_info(self) -> Dict[str, int]:
+        """Возвращает метрики кэша результатов поиска."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._query_cache),
+            "maxsize": self.cache_size,
+            "generation": self.generation,
+        }
+
+    def _maybe_spill(self) -> None:
+        """Переносит артефакты из памяти в SQLite при превышении порога."""
+        if (self.spill_threshold is None
+                or not isinstance(self.storage, MemoryStorage)
+                or len(self.storage) <= self.spill_threshold):
+            return
+        spilled = SQLiteStorage(store_normalized_keys=self.store_normalized_keys)
+        spilled.add_many(self.storage)
+        self.storage.close()
+        self.storage = spilled
+        #у артефактов в новом хранилище другие идентификаторы
+        self._invalidate()
+
+    def export(self, path: str, fmt: str = "jsonl") -> int:
+        """Потоково выгружает артефакты в файл (jsonl или binary), возвращает их число."""
+        with open(path, "wb", buffering=IO_BUFFER) as f:
+            return WRITERS[fmt](self.storage, f)
+
+    def import_file(self, path: str, fmt: str = "jsonl") -> int:
+        """Загружает артефакты из выгрузки пачками через add_many, возвращает их число."""
+        count = 0
+        with open(path, "rb", buffering=IO_BUFFER) as f:
+            items = READERS[fmt](f)
+            while True:
+                chunk = list(islice(items, IMPORT_CHUNK))
+                if not chunk:
+                    return count
+                self.add_many(chunk)
+                count += len(chunk)
+
+    def memory_report(self, sample_size: Optional[int] = None) -> Dict:
+        """Отчет о памяти артефактов; sample_size ограничивает число измеряемых объектов."""
+        sampled = list(self.storage) if sample_size is None else self.storage.sample(sample_size)
+        return memory_report(self.storage.type_counts(), sampled, self.storage.size_bytes())
+
+    def close(self) -> None:
+        """Закрывает хранилище (удаляет временную базу SQLite)."""
+        self.storage.close()
 
     def print_all(self) -> None:
         """Выводит все артефакты из репозитория."""
-        for item in self.items:
+        for item in self.storage:
             print(item)
@@ -0,0 +1,403 @@
+"""Модуль с хранилищами артефактов для Repository (в памяти и SQLite)."""
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import weakref
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+from classes import Artifact, normalize_key
+
+# атрибуты, которые хранятся в отдельных колонках таблицы
+COLUMNS = ("content", "author", "country")
+# колонки с нормализованными копиями атрибутов для REM attr~i"value"
+NORM_COLUMNS = tuple(f"{column}_norm" for column in COLUMNS)
+# с какого размера MemoryStorage ищет параллельно
+PARALLEL_THRESHOLD = 50_000
+
+
+class Storage(ABC):
+    """Абстрактное хранилище артефактов с целочисленными идентификаторами."""
+
+    @abstractmethod
+    def add(self, item: Artifact) -> int:
+        """Добавляет артефакт и возвращает его идентификатор."""
+
+    def add_many(self, items: Iterable[Artifact]) -> int:
+        """Добавляет несколько артефактов, возвращает их число."""
+        count = 0
+        for item in items:
+            self.add(item)
+            count += 1
+        return count
+
+    @abstractmethod
+    def find_ids(self, attr: str, value: str, ignore_case: bool = False) -> List[int]:
+        """Возвращает идентификаторы артефактов, подходящих под attr~value.
+
+        При ignore_case value уже нормализован функцией normalize_key.
+        """
+
+    def find_ids_by_pattern(self, attr: str, regex: Pattern,
+                            literals: Tuple[str, ...] = ()) -> List[int]:
+        """Возвращает идентификаторы артефактов, подходящих под attr~/pattern/."""
+        return [
+            item_id for item_id, item in self.items_with_ids()
+            if item.matches_pattern(attr, regex, literals)
+        ]
+
+    @abstractmethod
+    def remove_ids(self, ids: Iterable[int]) -> None:
+        """Удаляет артефакты с указанными идентификаторами."""
+
+    @abstractmethod
+    def items_with_ids(self) -> Iterator[Tuple[int, Artifact]]:
+        """Перебирает пары (идентификатор, артефакт) в порядке добавления.
+
+        Перебор идет без копии, поэтому менять хранилище во время него нельзя.
+        """
+
+    @abstractmethod
+    def items_after(self, item_id: int) -> Iterator[Tuple[int, Artifact]]:
+        """Перебирает артефакты, добавленные после артефакта с идентификатором item_id."""
+
+    @abstractmethod
+    def last_id(self) -> int:
+        """Идентификатор последнего добавленного артефакта (0, если их не было)."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Количество артефактов в хранилище."""
+
+    def __iter__(self) -> Iterator[Artifact]:
+        for _, item in self.items_with_ids():
+            yield item
+
+    def size_bytes(self) -> int:
+        """Размер самого контейнера хранилища в байтах (без артефактов)."""
+        return 0
+
+    @abstractmethod
+    def type_counts(self) -> Dict[str, int]:
+        """Число артефактов каждого типа."""
+
+    @abstractmethod
+    def sample(self, size: int, seed: int = 0) -> List[Artifact]:
+        """Случайная выборка из не более чем size артефактов."""
+
+    def close(self) -> None:
+        """Освобождает ресурсы хранилища."""
+
+
+def gil_enabled() -> bool:
+    """True, если интерпретатор работает с GIL (обычная сборка CPython)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+class MemoryStorage(Storage):
+    """Хранилище в памяти: словарь id -> артефакт (сохраняет порядок).
+
+    Поиск может идти параллельно: артефакты делятся на куски, которые
+    проверяются в ThreadPoolExecutor. Параллельный режим возможен только
+    при размере не меньше parallel_threshold и workers > 1. Кроме того,
+    при parallel=None (по умолчанию) он включается только на free-threaded
+    сборках; parallel=True включает его и при GIL, parallel=False отключает.
+    """
+
+    def __init__(self, workers: Optional[int] = None, parallel: Optional[bool] = None,
+                 parallel_threshold: int = PARALLEL_THRESHOLD):
+        self._items: Dict[int, Artifact] = {}
+        self._next_id = 1
+        self.workers = workers or os.cpu_count() or 1
+        self.parallel = parallel
+        self.parallel_threshold = parallel_threshold
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def add(self, item: Artifact) -> int:
+        item_id = self._next_id
+        self._next_id += 1
+        self._items[item_id] = item
+        return item_id
+
+    def add_many(self, items: Iterable[Artifact]) -> int:
+        start = self._next_id
+        for item in items:
+            self._items[self._next_id] = item
+            self._next_id += 1
+        return self._next_id - start
+
+    def find_ids(self, attr: str, value: str, ignore_case: bool = False) -> List[int]:
+        if ignore_case:
+            return self._scan(lambda item: item.matches_ignore_case(attr, value))
+        return self._scan(lambda item: item.matches_condition(attr, value))
+
+    def find_ids_by_pattern(self, attr: str, regex: Pattern,
+                            literals: Tuple[str, ...] = ()) -> List[int]:
+        return self._scan(lambda item: item.matches_pattern(attr, regex, literals))
+
+    def _use_parallel(self) -> bool:
+        """Решает, нужен ли параллельный поиск для текущего размера."""
+        if self.workers < 2 or len(self._items) < self.parallel_threshold:
+            return False
+        return not gil_enabled() if self.parallel is None else self.parallel
+
+    def _scan(self, predicate: Callable[[Artifact], bool]) -> List[int]:
+        """Возвращает идентификаторы артефактов, для которых predicate истинен."""
+        if not self._use_parallel():
+            return [item_id for item_id, item in self._items.items() if predicate(item)]
+
+        pairs = list(self._items.items())
+        size = -(-len(pairs) // self.workers)
+        chunks = [pairs[start:start + size] for start in range(0, len(pairs), size)]
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        #map возвращает результаты в порядке кусков, поэтому порядок сохраняется
+        found = self._pool.map(
+            lambda chunk: [item_id for item_id, item in chunk if predicate(item)], chunks
+        )
+        return [item_id for chunk_ids in found for item_id in chunk_ids]
+
+    def remove_ids(self, ids: Iterable[int]) -> None:
+        for item_id in ids:
+            del self._items[item_id]
+
+    def items_with_ids(self) -> Iterator[Tuple[int, Artifact]]:
+        #без копирования: хранилище нельзя менять, пока идет перебор
+        return iter(self._items.items())
+
+    def items_after(self, item_id: int) -> Iterator[Tuple[int, Artifact]]:
+        for next_id in range(item_id + 1, self._next_id):
+            item = self._items.get(next_id)
+            if item is not None:
+                yield next_id, item
+
+    def last_id(self) -> int:
+        return self._next_id - 1
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def size_bytes(self) -> int:
+        return sys.getsizeof(self._items)
+
+    def type_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for item in self._items.values():
+            counts[item.type_name()] = counts.get(item.type_name(), 0) + 1
+        return counts
+
+    def sample(self, size: int, seed: int = 0) -> List[Artifact]:
+        if size >= len(self._items):
+            return list(self._items.values())
+        #выбираем позиции и проходим словарь один раз, не копируя его
+        positions = set(random.Random(seed).sample(range(len(self._items)), size))
+        return [item for pos, item in enumerate(self._items.values()) if pos in positions]
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+def _normalize_or_null(text: Optional[str]) -> Optional[str]:
+    """normalize_key для SQL: NULL остается NULL."""
+    return None if text is None else normalize_key(text)
+
+
+def _drop_temp_db(conn: sqlite3.Connection, path: str) -> None:
+    """Закрывает соединение и удаляет файл временной базы."""
+    conn.close()
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+class SQLiteStorage(Storage):
+    """Хранилище в SQLite с триграммным индексом FTS5 для поиска подстрок.
+
+    Если путь не указан, база создаётся во временном файле, который
+    удаляется при вызове close(), а если close() не вызван - при сборке
+    объекта мусором или при выходе из интерпретатора.
+    store_normalized_keys: хранить ли нормализованные копии атрибутов в
+    колонках *_norm (считаются при вставке и попадают в индекс) или
+    нормализовать значения в SQL при каждом поиске без учета регистра.
+    """
+
+    def __init__(self, path: Optional[str] = None, store_normalized_keys: bool = True):
+        self.store_normalized_keys = store_normalized_keys
+        self._temp_path = None
+        self._finalizer = None
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="repository_", suffix=".sqlite")
+            os.close(fd)
+            self._temp_path = path
+        self.conn = sqlite3.connect(path)
+        if self._temp_path is not None:
+            self._finalizer = weakref.finalize(self, _drop_temp_db, self.conn, path)
+        self.conn.create_function("normalize_key", 1, _normalize_or_null, deterministic=True)
+        if self._temp_path is not None:
+            #временная база - рабочий файл, устойчивость к сбоям ей не нужна
+            self.conn.execute("PRAGMA synchronous=OFF")
+            self.conn.execute("PRAGMA journal_mode=MEMORY")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS artifacts ("
+            "id INTEGER PRIMARY KEY, type TEXT NOT NULL, "
+            "content TEXT, author TEXT, country TEXT, "
+            "content_norm TEXT, author_norm TEXT, country_norm TEXT)"
+        )
+        self.has_fts = self._create_fts()
+        self.conn.commit()
+
+    def _create_fts(self) -> bool:
+        """Создаёт индекс FTS5 (trigram) и триггеры; False, если FTS5 недоступен."""
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS artifacts_fts USING fts5("
+                "content, author, country, content_norm, author_norm, country_norm, "
+                "content='artifacts', content_rowid='id', "
+                "tokenize='trigram')"
+            )
+        except sqlite3.OperationalError:
+            return False
+        self.conn.executescript(
+            "CREATE TRIGGER IF NOT EXISTS artifacts_ai AFTER INSERT ON artifacts BEGIN "
+            "INSERT INTO artifacts_fts(rowid, content, author, country, "
+            "content_norm, author_norm, country_norm) "
+            "VALUES (new.id, new.content, new.author, new.country, "
+            "new.content_norm, new.author_norm, new.country_norm); END;"
+            "CREATE TRIGGER IF NOT EXISTS artifacts_ad AFTER DELETE ON artifacts BEGIN "
+            "INSERT INTO artifacts_fts(artifacts_fts, rowid, content, author, country, "
+            "content_norm, author_norm, country_norm) "
+            "VALUES ('delete', old.id, old.content, old.author, old.country, "
+            "old.content_norm, old.author_norm, old.country_norm); END;"
+        )
+        return True
+
+    def _row(self, item: Artifact) -> tuple:
+        """Превращает артефакт в строку таблицы вместе с нормализованными копиями."""
+        row = (item.type_name(),) + tuple(getattr(item, c, None) for c in COLUMNS)
+        if not self.store_normalized_keys:
+            return row + (None,) * len(COLUMNS)
+        return row + tuple(item.normalized_value(c) for c in COLUMNS)
+
+    def add(self, item: Artifact) -> int:
+        cur = self.conn.execute(
+            "INSERT INTO artifacts(type, content, author, country, "
+            "content_norm, author_norm, country_norm) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self._row(item)
+        )
+        #commit откладывается до удаления, пакетной вставки или close
+        return cur.lastrowid
+
+    def add_many(self, items: Iterable[Artifact]) -> int:
+        self.conn.commit()
+        start = self.last_id()
+        #строки генерируются на лету, весь набор второй раз в памяти не строится;
+        #with - одна транзакция: при ошибке пачка откатывается целиком
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO artifacts(id, type, content, author, country, "
+                "content_norm, author_norm, country_norm) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((start + n,) + self._row(item) for n, item in enumerate(items, 1))
+            )
+        return self.last_id() - start
+
+    def find_ids(self, attr: str, value: str, ignore_case: bool = False) -> List[int]:
+        if attr not in COLUMNS:
+            return []
+        column = attr
+        if ignore_case:
+            if not self.store_normalized_keys:
+                #нормализованные копии не хранятся, считаем их в SQL
+                rows = self.conn.execute(
+                    f"SELECT id FROM artifacts WHERE instr(normalize_key({attr}), ?) > 0 "
+                    f"ORDER BY id",
+                    (value,)
+                )
+                return [row[0] for row in rows]
+            column = f"{attr}_norm"
+        #триграммный индекс отсекает кандидатов, instr проверяет точное совпадение
+        if self.has_fts and len(value) >= 3:
+            query = f'{column} : "' + value.replace('"', '""') + '"'
+            rows = self.conn.execute(
+                f"SELECT id FROM artifacts WHERE id IN "
+                f"(SELECT rowid FROM artifacts_fts WHERE artifacts_fts MATCH ?) "
+                f"AND instr({column}, ?) > 0 ORDER BY id",
+                (query, value)
+            )
+        else:
+            rows = self.conn.execute(
+                f"SELECT id FROM artifacts WHERE instr({column}, ?) > 0 ORDER BY id",
+                (value,)
+            )
+        return [row[0] for row in rows]
+
+    def find_ids_by_pattern(self, attr: str, regex: Pattern,
+                            literals: Tuple[str, ...] = ()) -> List[int]:
+        if attr not in COLUMNS:
+            return []
+        #обязательные подстроки отсекают кандидатов в SQL, regex проверяется в Python
+        sql = f"SELECT id, {attr} FROM artifacts WHERE {attr} IS NOT NULL"
+        params: list = []
+        if self.has_fts and literals and len(literals[0]) >= 3:
+            sql += (" AND id IN (SELECT rowid FROM artifacts_fts "
+                    "WHERE artifacts_fts MATCH ?)")
+            params.append(f'{attr} : "' + literals[0].replace('"', '""') + '"')
+        for literal in literals:
+            sql += f" AND instr({attr}, ?) > 0"
+            params.append(literal)
+        rows = self.conn.execute(sql + " ORDER BY id", params)
+        return [item_id for item_id, text in rows if regex.search(text) is not None]
+
+    def remove_ids(self, ids: Iterable[int]) -> None:
+        self.conn.executemany("DELETE FROM artifacts WHERE id = ?", ((i,) for i in ids))
+        self.conn.commit()
+
+    def items_with_ids(self) -> Iterator[Tuple[int, Artifact]]:
+        return self.items_after(0)
+
+    def items_after(self, item_id: int) -> Iterator[Tuple[int, Artifact]]:
+        rows = self.conn.execute(
+            "SELECT id, type, content, author, country FROM artifacts WHERE id > ? ORDER BY id",
+            (item_id,)
+        )
+        for row_id, type_name, content, author, country in rows:
+            yield row_id, Artifact.create(
+                type_name, content=content, author=author, country=country
+            )
+
+    def last_id(self) -> int:
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM artifacts").fetchone()[0]
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+
+    def type_counts(self) -> Dict[str, int]:
+        return dict(self.conn.execute("SELECT type, COUNT(*) FROM artifacts GROUP BY type"))
+
+    def sample(self, size: int, seed: int = 0) -> List[Artifact]:
+        #random() в SQLite не принимает seed, выборка не воспроизводима
+        rows = self.conn.execute(
+            "SELECT type, content, author, country FROM artifacts ORDER BY random() LIMIT ?",
+            (size,)
+        )
+        return [
+            Artifact.create(type_name, content=content, author=author, country=country)
+            for type_name, content, author, country in rows
+        ]
+
+    def size_bytes(self) -> int:
+        #для SQLite это размер файла базы на диске
+        page_count = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+        return page_count * page_size
+
+    def close(self) -> None:
+        self.conn.commit()
+        if self._finalizer is not None:
+            self._finalizer()
+        else:
+            self.conn.close()
@@ -0,0 +1,112 @@
+"""Модульные тесты для выгрузки и загрузки артефактов (EXPORT/IMPORT)."""
+import unittest
+import sys
+import os
+import tempfile
+from io import BytesIO, StringIO
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from artifact_io import FORMATS, read_binary, read_jsonl, split_path_format, write_binary
+from comand_parser import CommandProcessor
+from repository import Repository
+from classes import Aphorism, Proverb
+
+
+class TestArtifactIO(unittest.TestCase):
+    """Тесты для Repository.export/import_file и команд EXPORT/IMPORT."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.repo = Repository()
+        self.repo.add(Aphorism('Он сказал: "Знание — сила"', "Фрэнсис Бэкон"))
+        self.repo.add(Proverb("Без труда не выловишь и рыбку из пруда", "Россия"))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_round_trip(self):
+        """Тест: выгрузка и загрузка сохраняют типы, поля и порядок."""
+        for fmt in FORMATS:
+            with self.subTest(fmt=fmt):
+                path = os.path.join(self.tmpdir.name, f"export.{fmt}")
+                self.assertEqual(self.repo.export(path, fmt), 2)
+
+                loaded = Repository()
+                self.assertEqual(loaded.import_file(path, fmt), 2)
+                self.assertEqual(
+                    [item.to_dict() for item in loaded.items],
+                    [item.to_dict() for item in self.repo.items]
+                )
+
+    def test_binary_truncated(self):
+        """Тест: обрезанная бинарная выгрузка дает ошибку."""
+        buffer = BytesIO()
+        write_binary(self.repo.items, buffer)
+        with self.assertRaises(ValueError):
+            list(read_binary(BytesIO(buffer.getvalue()[:-3])))
+
+    def test_binary_malformed_records(self):
+        """Тест: любые испорченные записи дают ValueError, а не struct.error."""
+        buffer = BytesIO()
+        write_binary(self.repo.items, buffer)
+        data = buffer.getvalue()
+        bad_tails = (
+            b"\x01\x00",                       # обрезанная длина записи
+            b"\x00\x00\x00\x00",               # пустая запись
+            b"\x03\x00\x00\x00\x01\x05\x00",   # обрезанная длина поля
+            b"\x05\x00\x00\x00\x01\x09\x00\x00\x00",  # поле длиннее записи
+        )
+        for tail in bad_tails:
+            with self.subTest(tail=tail):
+                with self.assertRaises(ValueError):
+                    list(read_binary(BytesIO(data + tail)))
+
+    def test_jsonl_not_object(self):
+        """Тест: строка JSON, не являющаяся объектом, дает ValueError, а не AttributeError."""
+        for line in (b'"abc"\n', b'[]\n', b'null\n'):
+            with self.subTest(line=line):
+                with self.assertRaises(ValueError):
+                    list(read_jsonl(BytesIO(line)))
+
+    def test_import_truncated_file_command(self):
+        """Тест: IMPORT обрезанного файла сообщает об ошибке и не прерывает выполнение."""
+        path = os.path.join(self.tmpdir.name, "export.bin")
+        self.repo.export(path, "binary")
+        with open(path, "ab") as f:
+            f.write(b"\x01\x00")
+
+        processor = CommandProcessor()
+        f = StringIO()
+        with redirect_stdout(f):
+            processor.process_line(f'IMPORT {path} binary')
+        self.assertIn("Бинарная выгрузка обрезана", f.getvalue())
+
+    def test_split_path_format(self):
+        """Тест разбора аргументов EXPORT/IMPORT."""
+        self.assertEqual(split_path_format("out dir/a.jsonl jsonl"), ("out dir/a.jsonl", "jsonl"))
+        with self.assertRaises(ValueError):
+            split_path_format("a.csv csv")
+        with self.assertRaises(ValueError):
+            split_path_format("a.jsonl")
+
+    def test_export_import_commands(self):
+        """Тест команд EXPORT и IMPORT."""
+        path = os.path.join(self.tmpdir.name, "export.bin")
+        processor = CommandProcessor()
+        processor.process_line('ADD APHORISM;content="Знание — сила";author="Фрэнсис Бэкон"')
+        processor.process_line(f'EXPORT {path} binary')
+
+        other = CommandProcessor()
+        other.process_line(f'IMPORT {path} binary')
+        self.assertEqual(other.repo.items[0].author, "Фрэнсис Бэкон")
+
+        f = StringIO()
+        with redirect_stdout(f):
+            other.process_line(f'IMPORT {path} xml')
+        self.assertIn("Неизвестный формат выгрузки: xml", f.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
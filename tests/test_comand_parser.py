@@ -216,6 +216,89 @@ class TestCommandProcessor(unittest.TestCase):
         with self.assertRaises(FileNotFoundError):
             self.processor.execute_file("nonexistent_file.txt")
 
+    def test_transaction_commit(self):
+        """Тест: ADD внутри BEGIN/COMMIT применяются только на COMMIT."""
+        self.processor.process_line('BEGIN')
+        self.processor.process_line('ADD APHORISM;content="Знание — сила";author="Фрэнсис Бэкон"')
+        self.processor.process_line('ADD PROVERB;content="Без труда...";country="Россия"')
+
+        self.assertEqual(len(self.processor.repo.items), 0)
+
+        self.processor.process_line('COMMIT')
+
+        self.assertEqual(len(self.processor.repo.items), 2)
+        self.assertIsNone(self.processor.batch)
+
+    def test_transaction_rollback(self):
+        """Тест: ROLLBACK отбрасывает буфер транзакции."""
+        self.processor.process_line('BEGIN')
+        self.processor.process_line('ADD APHORISM;content="Знание — сила";author="Фрэнсис Бэкон"')
+        self.processor.process_line('ROLLBACK')
+
+        self.assertEqual(len(self.processor.repo.items), 0)
+
+    def test_transaction_failed_batch_untouched(self):
+        """Тест: ошибка внутри транзакции отменяет всю пачку."""
+        self.processor.process_line('ADD APHORISM;content="До транзакции";author="Автор"')
+
+        f = StringIO()
+        with redirect_stdout(f):
+            self.processor.process_line('BEGIN')
+            self.processor.process_line('ADD APHORISM;content="Знание — сила";author="Фрэнсис Бэкон"')
+            self.processor.process_line('ADD PROVERB;content="Без страны"')
+            self.processor.process_line('COMMIT')
+
+        self.assertIn("Транзакция отменена", f.getvalue())
+        self.assertEqual([i.content for i in self.processor.repo.items], ["До транзакции"])
+
+    def test_transaction_rem_rejected(self):
+        """Тест: REM внутри транзакции запрещен и проваливает ее."""
+        f = StringIO()
+        with redirect_stdout(f):
+            self.processor.process_line('BEGIN')
+            self.processor.process_line('REM content~"сила"')
+            self.processor.process_line('COMMIT')
+
+        self.assertIn("REM внутри транзакции", f.getvalue())
+
+    def test_commit_without_begin(self):
+        """Тест COMMIT без BEGIN."""
+        f = StringIO()
+        with redirect_stdout(f):
+            self.processor.process_line('COMMIT')
+
+        self.assertIn("COMMIT без BEGIN", f.getvalue())
+
+    def test_process_rem_regex(self):
+        """Тест обработки команды REM с регулярным выражением."""
+        self.processor.process_line('ADD APHORISM;content="Знание — сила";author="Фрэнсис Бэкон"')
+        self.processor.process_line('ADD APHORISM;content="Мыслю, следовательно существую";author="Рене Декарт"')
+        self.processor.process_line('ADD PROVERB;content="Без труда...";country="Россия"')
+
+        self.processor.process_line(r'REM author~/^(Фрэнсис|Рене) \w+$/')
+
+        self.assertEqual(len(self.processor.repo.items), 1)
+        self.assertEqual(self.processor.repo.items[0].content, "Без труда...")
+
+    def test_process_rem_invalid_regex(self):
+        """Тест обработки REM с некорректным регулярным выражением."""
+        f = StringIO()
+        with redirect_stdout(f):
+            self.processor.process_line('REM content~/(/')
+
+        self.assertIn("Ошибка при обработке команды REM", f.getvalue())
+
+    def test_process_rem_ignore_case(self):
+        """Тест REM без учета регистра: content~i"..."."""
+        self.processor.process_line('ADD PROVERB;content="Без труда не выловишь и рыбку из пруда";country="Россия"')
+        self.processor.process_line('ADD PROVERB;content="Рыбку ловить — не в лодке сидеть";country="Россия"')
+        self.processor.process_line('ADD PROVERB;content="When in Rome...";country="Англия"')
+
+        self.processor.process_line('REM content~i"РЫБКУ"')
+
+        self.assertEqual(len(self.processor.repo.items), 1)
+        self.assertEqual(self.processor.repo.items[0].country, "Англия")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
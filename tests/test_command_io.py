@@ -0,0 +1,64 @@
+"""Модульные тесты для чтения сжатых файлов команд."""
+import unittest
+import sys
+import os
+import bz2
+import gzip
+import lzma
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from command_io import open_commands
+from comand_parser import CommandProcessor
+
+COMMANDS = (
+    'ADD APHORISM;content="Знание — сила";author="Фрэнсис Бэкон"\n'
+    'ADD PROVERB;content="Без труда...";country="Россия"\n'
+    'REM content~"сила"\n'
+)
+
+
+class TestCompressedInput(unittest.TestCase):
+    """Тесты для open_commands и execute_file со сжатыми файлами."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, name, opener):
+        """Записывает COMMANDS в файл с помощью opener и возвращает путь."""
+        path = os.path.join(self.tmpdir.name, name)
+        with opener(path, "wt", encoding="utf-8") as f:
+            f.write(COMMANDS)
+        return path
+
+    def test_formats_detected_by_magic(self):
+        """Тест: формат определяется по сигнатуре, даже без расширения."""
+        for name, opener in (("a.gz", gzip.open), ("b.bz2", bz2.open),
+                             ("c.xz", lzma.open), ("d.cmd", gzip.open), ("e.txt", open)):
+            with self.subTest(name=name):
+                path = self.write(name, opener)
+                with open_commands(path) as f:
+                    self.assertEqual(f.read(), COMMANDS)
+
+    def test_plain_file_with_compressed_extension(self):
+        """Тест: несжатый файл с расширением .gz читается как обычный текст."""
+        path = self.write("plain.gz", open)
+        with open_commands(path) as f:
+            self.assertEqual(f.read(), COMMANDS)
+
+    def test_execute_compressed_file(self):
+        """Тест выполнения команд из сжатого файла."""
+        path = self.write("commands.txt.gz", gzip.open)
+        processor = CommandProcessor()
+        processor.execute_file(path)
+
+        self.assertEqual(len(processor.repo.items), 1)
+        self.assertEqual(processor.repo.items[0].content, "Без труда...")
+
+
+if __name__ == '__main__':
+    unittest.main()
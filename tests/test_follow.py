@@ -0,0 +1,111 @@
+"""Модульные тесты для режима follow у CommandProcessor."""
+import unittest
+import sys
+import os
+import tempfile
+from io import StringIO
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from comand_parser import CommandProcessor
+
+LINE1 = 'ADD APHORISM;content="Знание — сила";author="Фрэнсис Бэкон"\n'
+LINE2 = 'ADD PROVERB;content="Без труда...";country="Россия"\n'
+LINE3 = 'ADD APHORISM;content="Мыслю, следовательно существую";author="Рене Декарт"\n'
+
+
+class TestFollow(unittest.TestCase):
+    """Тесты для follow_once и follow."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "commands.txt")
+        self.offset_file = os.path.join(self.tmpdir.name, "commands.offset")
+        self.processor = CommandProcessor()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def append(self, text, mode="a"):
+        with open(self.filename, mode, encoding="utf-8") as f:
+            f.write(text)
+
+    def test_only_new_complete_lines(self):
+        """Тест: выполняются только новые завершенные строки."""
+        self.append(LINE1 + LINE2[:10])
+        self.assertEqual(self.processor.follow_once(self.filename), 1)
+        self.assertEqual(len(self.processor.repo.items), 1)
+
+        self.append(LINE2[10:])
+        self.assertEqual(self.processor.follow_once(self.filename), 1)
+        self.assertEqual(self.processor.follow_once(self.filename), 0)
+        self.assertEqual(len(self.processor.repo.items), 2)
+        self.assertEqual(self.processor.repo.items[1].content, "Без труда...")
+
+    def test_transaction_does_not_reset_offset(self):
+        """Тест: BEGIN/COMMIT в дописанных строках не сбивают позицию."""
+        self.append(LINE1)
+        self.processor.follow_once(self.filename)
+
+        self.append('BEGIN\n' + LINE2 + 'COMMIT\n')
+        self.assertEqual(self.processor.follow_once(self.filename), 3)
+        self.assertEqual(self.processor.follow_offset, os.path.getsize(self.filename))
+
+        f = StringIO()
+        with redirect_stdout(f):
+            self.assertEqual(self.processor.follow_once(self.filename), 0)
+        self.assertEqual(f.getvalue(), "")
+        self.assertEqual(len(self.processor.repo.items), 2)
+
+    def test_truncation_restarts_from_beginning(self):
+        """Тест: после усечения файла чтение идет с начала."""
+        self.append(LINE1 + LINE2)
+        self.processor.follow_once(self.filename)
+
+        self.append(LINE3, mode="w")
+        self.assertEqual(self.processor.follow_once(self.filename), 1)
+        self.assertEqual(self.processor.repo.items[-1].author, "Рене Декарт")
+
+    def test_rotation_restarts_from_beginning(self):
+        """Тест: после замены файла (ротации) новый файл читается с начала."""
+        self.append(LINE1 + LINE2)
+        self.processor.follow_once(self.filename)
+
+        os.rename(self.filename, self.filename + ".1")
+        self.assertEqual(self.processor.follow_once(self.filename), 0)
+        self.append(LINE1 + LINE2 + LINE3)
+        self.assertEqual(self.processor.follow_once(self.filename), 3)
+
+    def test_offset_persisted_between_restarts(self):
+        """Тест: сохраненная позиция позволяет не повторять строки."""
+        self.append(LINE1)
+        self.processor.follow(self.filename, offset_file=self.offset_file, max_polls=1)
+
+        self.append(LINE2)
+        restarted = CommandProcessor()
+        restarted.follow(self.filename, offset_file=self.offset_file, max_polls=1)
+
+        self.assertEqual(len(restarted.repo.items), 1)
+        self.assertEqual(restarted.repo.items[0].content, "Без труда...")
+
+    def test_restart_inside_open_transaction(self):
+        """Тест: при открытой транзакции сохраняется позиция BEGIN, ADD не теряются."""
+        self.append(LINE1 + 'BEGIN\n' + LINE2)
+        self.processor.follow_once(self.filename, self.offset_file)
+        self.assertEqual(len(self.processor.repo.items), 1)
+
+        self.append('COMMIT\n')
+        restarted = CommandProcessor()
+        f = StringIO()
+        with redirect_stdout(f):
+            self.assertEqual(restarted.follow_once(self.filename, self.offset_file), 3)
+        self.assertEqual(f.getvalue(), "")
+        self.assertEqual([i.content for i in restarted.repo.items], ["Без труда..."])
+
+        again = CommandProcessor()
+        self.assertEqual(again.follow_once(self.filename, self.offset_file), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""Модульные тесты для отчета о памяти (MEMSTATS)."""
+import unittest
+import sys
+import os
+import tracemalloc
+from io import StringIO
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from repository import Repository
+from storage import SQLiteStorage
+from comand_parser import CommandProcessor
+from classes import Aphorism, Proverb
+
+
+class TestMemoryReport(unittest.TestCase):
+    """Тесты для Repository.memory_report и команды MEMSTATS."""
+
+    def setUp(self):
+        self.repo = Repository()
+        author = "Фрэнсис Бэкон"
+        for n in range(100):
+            self.repo.add(Aphorism(f"Афоризм {n}", author))
+        for n in range(50):
+            self.repo.add(Proverb(f"Пословица {n}", f"Страна {n}"))
+
+    def test_counts_and_sizes(self):
+        """Тест количества объектов и размеров по типам и атрибутам."""
+        report = self.repo.memory_report()
+
+        self.assertEqual(report["count"], 150)
+        self.assertEqual(report["types"]["APHORISM"]["count"], 100)
+        self.assertEqual(report["types"]["PROVERB"]["count"], 50)
+        self.assertEqual(
+            set(report["types"]["APHORISM"]["attributes"]), {"content", "author", "_normalized"}
+        )
+        self.assertGreater(report["deep_bytes"], 0)
+        self.assertGreater(report["container_bytes"], 0)
+        # 99 из 300 ссылок на строки указывают на одну и ту же строку автора
+        self.assertAlmostEqual(report["string_sharing"], 99 / 300)
+
+    def test_sampling(self):
+        """Тест: при выборке измеряется не больше sample_size объектов."""
+        full = self.repo.memory_report()
+        report = self.repo.memory_report(sample_size=30)
+
+        self.assertEqual(report["sampled"], 30)
+        self.assertEqual(report["count"], 150)
+        self.assertAlmostEqual(report["deep_bytes"], full["deep_bytes"], delta=full["deep_bytes"] * 0.2)
+
+    def test_sampling_sqlite_storage(self):
+        """Тест: для SQLite типы считаются в SQL, строится только выборка."""
+        repo = Repository(storage=SQLiteStorage())
+        try:
+            repo.add_many(self.repo.items)
+            report = repo.memory_report(sample_size=10)
+
+            self.assertEqual(report["count"], 150)
+            self.assertEqual(report["sampled"], 10)
+            self.assertEqual(sum(t["count"] for t in report["types"].values()), 150)
+            self.assertGreater(report["container_bytes"], 0)
+        finally:
+            repo.close()
+
+    def test_top_allocations_with_tracemalloc(self):
+        """Тест: места выделения памяти есть только при включенном tracemalloc."""
+        self.assertEqual(self.repo.memory_report()["top_allocations"], [])
+        tracemalloc.start()
+        try:
+            self.assertTrue(self.repo.memory_report()["top_allocations"])
+        finally:
+            tracemalloc.stop()
+
+    def test_memstats_command(self):
+        """Тест команды MEMSTATS."""
+        processor = CommandProcessor()
+        processor.process_line('ADD APHORISM;content="Знание — сила";author="Фрэнсис Бэкон"')
+
+        f = StringIO()
+        with redirect_stdout(f):
+            processor.process_line('MEMSTATS')
+            processor.process_line('MEMSTATS abc')
+
+        output = f.getvalue()
+        self.assertIn("Артефактов: 1", output)
+        self.assertIn("[APHORISM] count=1", output)
+        self.assertIn("не число", output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,38 @@
+"""Модульные тесты для кэша регулярных выражений и извлечения литералов."""
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from patterns import compile_pattern, required_literals
+from classes import Aphorism
+
+
+class TestPatterns(unittest.TestCase):
+    """Тесты для compile_pattern и required_literals."""
+
+    def test_compile_is_cached(self):
+        """Тест: повторная компиляция возвращает тот же объект."""
+        self.assertIs(compile_pattern(r"сил\w"), compile_pattern(r"сил\w"))
+
+    def test_required_literals(self):
+        """Тест извлечения обязательных подстрок."""
+        self.assertEqual(required_literals(r"номер 12\d+"), ("номер 12",))
+        self.assertEqual(required_literals(r"^ab(cd)+x?yz$"), ("ab", "cd", "yz"))
+        self.assertEqual(required_literals(r"рыбку|пруда"), ())
+        self.assertEqual(required_literals(r"(?i)сила"), ())
+        self.assertEqual(required_literals(r"a*b"), ("b",))
+
+    def test_matches_pattern(self):
+        """Тест проверки артефакта по регулярному выражению."""
+        item = Aphorism("Знание — сила", "Фрэнсис Бэкон")
+        regex = compile_pattern(r"сил[аы]")
+
+        self.assertTrue(item.matches_pattern("content", regex, ("сил",)))
+        self.assertFalse(item.matches_pattern("content", regex, ("мощь",)))
+        self.assertFalse(item.matches_pattern("country", regex))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -117,6 +117,104 @@ class TestRepository(unittest.TestCase):
         except Exception as e:
             self.fail(f"print_all вызвал исключение: {e}")
 
+    def test_query_cache_hits_and_incremental_add(self):
+        """Тест кэша результатов: попадания и дописывание при ADD."""
+        self.repo.add(self.aphorism1)
+        self.repo.add(self.proverb1)
+
+        self.assertEqual(len(self.repo.find_ids("content", "сила")), 1)
+        self.assertEqual(len(self.repo.find_ids("content", "сила")), 1)
+        self.assertEqual(self.repo.cache_info()["hits"], 1)
+        self.assertEqual(self.repo.cache_info()["misses"], 1)
+
+        # новый подходящий артефакт попадает в закэшированный результат
+        self.repo.add(Aphorism("Сила в правде, а правда — сила", "Неизвестный"))
+        self.assertEqual(len(self.repo.find_ids("content", "сила")), 2)
+        self.assertEqual(self.repo.cache_info()["hits"], 2)
+
+    def test_query_cache_catches_up_lazily(self):
+        """Тест: ADD не трогает кэш, новые артефакты досматриваются при попадании."""
+        self.repo.add(self.aphorism1)
+        self.repo.find_ids("author", "Декарт")
+
+        self.repo.add(self.aphorism2)
+        self.assertEqual(self.repo._query_cache[("author", "Декарт", False)][1], [])
+
+        self.assertEqual(len(self.repo.find_ids("author", "Декарт")), 1)
+        self.assertEqual(self.repo.cache_info()["hits"], 1)
+
+    def test_query_cache_invalidated_by_remove(self):
+        """Тест: удаление увеличивает поколение и сбрасывает кэш."""
+        self.repo.add(self.aphorism1)
+        self.repo.add(self.aphorism2)
+        self.repo.find_ids("author", "Декарт")
+
+        self.repo.remove_by_condition("content", "сила")
+
+        self.assertEqual(self.repo.cache_info()["generation"], 1)
+        self.assertEqual(len(self.repo.find_ids("author", "Декарт")), 1)
+        self.assertEqual(self.repo.find_ids("content", "сила"), [])
+        self.assertEqual(self.repo.cache_info()["hits"], 0)
+
+    def test_query_cache_bounded(self):
+        """Тест: размер кэша ограничен."""
+        repo = Repository(cache_size=2)
+        repo.add(self.aphorism1)
+        for value in ("а", "б", "в"):
+            repo.find_ids("content", value)
+
+        self.assertEqual(repo.cache_info()["size"], 2)
+
+    def test_add_many(self):
+        """Тест пакетного добавления с обновлением кэша."""
+        self.repo.add(self.aphorism1)
+        self.repo.find_ids("content", "сила")
+
+        self.repo.add_many([self.aphorism2, self.proverb1, Aphorism("Сила воли", "Автор")])
+
+        self.assertEqual(len(self.repo.items), 4)
+        self.assertEqual(self.repo.items[1], self.aphorism2)
+        self.assertEqual(len(self.repo.find_ids("content", "сила")), 1)
+        self.assertEqual(len(self.repo.find_ids("content", "ила")), 2)
+
+    def test_remove_ignore_case_normalized(self):
+        """Тест удаления без учета регистра с NFKC-нормализацией."""
+        self.repo.add(Aphorism("ＳＴＲＡẞＥ — улица", "Автор"))
+        self.repo.add(self.aphorism1)
+
+        self.repo.remove_by_condition("content", "strasse", ignore_case=True)
+
+        self.assertEqual(self.repo.items, [self.aphorism1])
+
+    def test_normalized_keys_toggle(self):
+        """Тест: нормализованные ключи хранятся только при включенной опции."""
+        repo = Repository(store_normalized_keys=False)
+        repo.add(self.aphorism1)
+        self.repo.add(self.aphorism2)
+
+        self.assertIsNone(self.aphorism1._normalized)
+        self.assertEqual(self.aphorism2._normalized["author"], "рене декарт")
+        self.assertEqual(len(repo.find_ids("author", "БЭКОН", ignore_case=True)), 1)
+        self.assertEqual(len(self.repo.find_ids("author", "ДЕКАРТ", ignore_case=True)), 1)
+
+    def test_normalized_keys_not_rem_target(self):
+        """Тест: нормализованные копии не являются атрибутом для REM."""
+        self.repo.add(self.aphorism1)
+
+        self.repo.remove_by_condition("normalized", "content")
+
+        self.assertEqual(self.repo.items, [self.aphorism1])
+
+    def test_query_cache_ignore_case_incremental(self):
+        """Тест: записи кэша без учета регистра дописываются при ADD."""
+        self.repo.add(self.aphorism1)
+        self.repo.find_ids("content", "СИЛА", ignore_case=True)
+
+        self.repo.add(Aphorism("Сила воли", "Автор"))
+
+        self.assertEqual(len(self.repo.find_ids("content", "сила", ignore_case=True)), 2)
+        self.assertEqual(self.repo.cache_info()["hits"], 1)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""Модульные тесты для хранилищ артефактов."""
+import unittest
+import sys
+import os
+import gc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from storage import MemoryStorage, SQLiteStorage, gil_enabled
+from repository import Repository
+from classes import Aphorism, Proverb
+from patterns import compile_pattern
+
+
+class StorageContract:
+    """Общие тесты, которые должно проходить любое хранилище."""
+
+    def make_storage(self):
+        raise NotImplementedError
+
+    def setUp(self):
+        """Подготовка данных перед каждым тестом."""
+        self.storage = self.make_storage()
+        self.storage.add(Aphorism("Знание — сила", "Фрэнсис Бэкон"))
+        self.storage.add(Proverb("Без труда не выловишь и рыбку из пруда", "Россия"))
+        self.storage.add(Aphorism("Мыслю, следовательно существую", "Рене Декарт"))
+
+    def tearDown(self):
+        self.storage.close()
+
+    def test_order_and_len(self):
+        """Тест порядка перебора и количества."""
+        self.assertEqual(len(self.storage), 3)
+        self.assertEqual(
+            [item.content for item in self.storage],
+            ["Знание — сила", "Без труда не выловишь и рыбку из пруда",
+             "Мыслю, следовательно существую"]
+        )
+
+    def test_add_many_from_generator(self):
+        """Тест пакетной вставки из генератора: возвращается число артефактов."""
+        count = self.storage.add_many(Aphorism(f"Афоризм {n}", "Автор") for n in range(5))
+
+        self.assertEqual(count, 5)
+        self.assertEqual(len(self.storage), 8)
+        self.assertEqual([i.content for i in self.storage][-1], "Афоризм 4")
+
+    def test_find_and_remove(self):
+        """Тест поиска по подстроке (длинной и короткой) и удаления."""
+        self.assertEqual(len(self.storage.find_ids("content", "рыбку")), 1)
+        self.assertEqual(len(self.storage.find_ids("author", "Р")), 1)
+        self.assertEqual(self.storage.find_ids("country", "Бэкон"), [])
+        self.assertEqual(self.storage.find_ids("nonexistent", "test"), [])
+
+        self.storage.remove_ids(self.storage.find_ids("content", "сил"))
+        self.assertEqual(len(self.storage), 2)
+        self.assertEqual(self.storage.find_ids("content", "сила"), [])
+
+    def test_find_is_case_sensitive(self):
+        """Тест: поиск, как и matches_condition, учитывает регистр."""
+        self.assertEqual(self.storage.find_ids("content", "знание"), [])
+
+    def test_find_ids_by_pattern(self):
+        """Тест поиска по регулярному выражению с обязательными подстроками."""
+        regex = compile_pattern(r"рыбку .. пруда")
+        self.assertEqual(len(self.storage.find_ids_by_pattern("content", regex, ("рыбку ", " пруда"))), 1)
+        self.assertEqual(len(self.storage.find_ids_by_pattern("author", compile_pattern(r"^Р"))), 1)
+        self.assertEqual(self.storage.find_ids_by_pattern("country", compile_pattern("Бэкон")), [])
+
+    def test_find_ignore_case(self):
+        """Тест поиска без учета регистра (значение уже нормализовано)."""
+        self.assertEqual(len(self.storage.find_ids("content", "знание", ignore_case=True)), 1)
+        self.assertEqual(self.storage.find_ids("country", "бэкон", ignore_case=True), [])
+
+
+class TestMemoryStorage(StorageContract, unittest.TestCase):
+    """Тесты для MemoryStorage."""
+
+    def make_storage(self):
+        return MemoryStorage()
+
+
+class TestParallelMemoryStorage(StorageContract, unittest.TestCase):
+    """Тесты для MemoryStorage с принудительным параллельным поиском."""
+
+    def make_storage(self):
+        return MemoryStorage(workers=2, parallel=True, parallel_threshold=0)
+
+    def test_parallel_keeps_order(self):
+        """Тест: результат параллельного поиска совпадает с последовательным."""
+        serial = MemoryStorage(parallel=False)
+        for n in range(1000):
+            item = Aphorism(f"Афоризм {n}", f"Автор {n % 7}")
+            self.storage.add(item)
+            serial.add(item)
+
+        self.assertEqual(
+            [i - 3 for i in self.storage.find_ids("author", "Автор 3")],
+            serial.find_ids("author", "Автор 3")
+        )
+        self.storage.remove_ids(self.storage.find_ids("author", "Автор 3"))
+        serial.remove_ids(serial.find_ids("author", "Автор 3"))
+        self.assertEqual([i.content for i in self.storage][3:], [i.content for i in serial])
+
+    def test_serial_below_threshold_or_with_gil(self):
+        """Тест выбора режима по порогу и наличию GIL."""
+        self.assertFalse(MemoryStorage(workers=4, parallel=True)._use_parallel())
+        auto = MemoryStorage(workers=4, parallel_threshold=0)
+        self.assertEqual(auto._use_parallel(), not gil_enabled())
+
+
+class TestSQLiteStorage(StorageContract, unittest.TestCase):
+    """Тесты для SQLiteStorage."""
+
+    def make_storage(self):
+        return SQLiteStorage()
+
+    def test_restored_types(self):
+        """Тест восстановления типов артефактов из таблицы."""
+        items = list(self.storage)
+        self.assertIsInstance(items[0], Aphorism)
+        self.assertIsInstance(items[1], Proverb)
+        self.assertEqual(items[1].country, "Россия")
+
+    def test_normalized_columns(self):
+        """Тест: нормализованные копии считаются при вставке, а без них - в SQL."""
+        row = self.storage.conn.execute(
+            "SELECT content_norm, author_norm, country_norm FROM artifacts ORDER BY id"
+        ).fetchone()
+        self.assertEqual(row, ("знание — сила", "фрэнсис бэкон", None))
+
+        plain = SQLiteStorage(store_normalized_keys=False)
+        try:
+            plain.add(Aphorism("ＳＴＲＡẞＥ — улица", "Автор"))
+            self.assertEqual(
+                plain.conn.execute("SELECT content_norm FROM artifacts").fetchone(), (None,)
+            )
+            self.assertEqual(len(plain.find_ids("content", "strasse", ignore_case=True)), 1)
+        finally:
+            plain.close()
+
+
+class TestRepositorySpill(unittest.TestCase):
+    """Тесты переноса репозитория из памяти в SQLite."""
+
+    def test_spill_after_threshold(self):
+        """Тест: после порога данные переезжают в SQLite без потерь."""
+        repo = Repository(spill_threshold=2)
+        try:
+            repo.add(Aphorism("Знание — сила", "Фрэнсис Бэкон"))
+            repo.add(Proverb("Без труда...", "Россия"))
+            self.assertIsInstance(repo.storage, MemoryStorage)
+
+            repo.add(Aphorism("Мыслю, следовательно существую", "Рене Декарт"))
+            self.assertIsInstance(repo.storage, SQLiteStorage)
+            self.assertEqual(len(repo.items), 3)
+
+            repo.remove_by_condition("author", "Декарт")
+            self.assertEqual([i.content for i in repo.items], ["Знание — сила", "Без труда..."])
+        finally:
+            repo.close()
+
+    def test_temp_db_removed(self):
+        """Тест: временная база удаляется и при close(), и без него при сборке мусора."""
+        repo = Repository(spill_threshold=0)
+        repo.add(Aphorism("Знание — сила", "Фрэнсис Бэкон"))
+        path = repo.storage._temp_path
+        self.assertTrue(os.path.exists(path))
+        repo.close()
+        self.assertFalse(os.path.exists(path))
+
+        storage = SQLiteStorage()
+        storage.add(Aphorism("Знание — сила", "Фрэнсис Бэкон"))
+        path = storage._temp_path
+        del storage
+        gc.collect()
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
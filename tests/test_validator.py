@@ -0,0 +1,131 @@
+"""Модульные тесты для проверки файла команд (режим --check)."""
+import unittest
+import sys
+import os
+import json
+import tempfile
+from io import StringIO
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from concurrent.futures import ProcessPoolExecutor
+
+from validator import validate_line, check_file, _check_chunk, _results_in_order
+from main import main
+
+
+class TestValidator(unittest.TestCase):
+    """Тесты для функций validate_line и check_file."""
+
+    def setUp(self):
+        """Создаем временный файл с корректными и ошибочными строками."""
+        commands = [
+            'ADD APHORISM;content="Знание — сила";author="Фрэнсис Бэкон"',
+            'ADD APHORISM content="нет точки с запятой"',
+            '',
+            'ADD TEXT;content="ASD";author="ASD"',
+            'ADD PROVERB;content="Без труда..."',
+            'REM content="test"',
+            'PRINT',
+            'UNKCOMMAND',
+        ]
+        with tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', delete=False) as f:
+            f.write('\n'.join(commands))
+            self.filename = f.name
+
+    def tearDown(self):
+        os.unlink(self.filename)
+
+    def test_validate_line_valid(self):
+        """Тест корректных строк."""
+        self.assertIsNone(validate_line('ADD PROVERB;content="a";country="b"'))
+        self.assertIsNone(validate_line('REM content~"a"'))
+        self.assertIsNone(validate_line('PRINT'))
+        self.assertIsNone(validate_line('   '))
+
+    def test_validate_line_invalid_regex(self):
+        """Тест REM с некорректным регулярным выражением."""
+        self.assertIsNone(validate_line(r'REM content~/сил\w/'))
+        self.assertEqual(validate_line('REM content~/(/')["kind"], "invalid_regex")
+
+    def test_validate_line_missing_param(self):
+        """Тест строки без обязательного параметра."""
+        error = validate_line('ADD APHORISM;content="test"')
+        self.assertEqual(error["kind"], "missing_param")
+        self.assertIn("author", error["message"])
+
+    def test_check_file_kinds_and_lines(self):
+        """Тест номеров строк и видов ошибок."""
+        result = check_file(self.filename)
+        self.assertEqual(
+            [(d["line"], d["kind"]) for d in result],
+            [(2, "missing_semicolon"), (4, "unknown_type"), (5, "missing_param"),
+             (6, "missing_tilde"), (8, "unknown_command")]
+        )
+
+    def test_check_file_parallel_same_result(self):
+        """Тест: параллельная проверка пачками дает тот же результат."""
+        serial = check_file(self.filename, workers=1)
+        parallel = check_file(self.filename, workers=2, chunk_size=2)
+        self.assertEqual(serial, parallel)
+
+    def test_check_file_transactions(self):
+        """Тест: ошибки порядка транзакций находятся и при разбиении на пачки."""
+        commands = [
+            'COMMIT',
+            'BEGIN',
+            'ADD APHORISM;content="a";author="b"',
+            'REM content~"a"',
+            'BEGIN',
+            'COMMIT',
+            'ROLLBACK',
+            'BEGIN',
+            'ADD APHORISM;content="c";author="d"',
+        ]
+        with open(self.filename, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(commands))
+
+        for workers, chunk_size in ((1, 5000), (2, 2)):
+            with self.subTest(workers=workers):
+                result = check_file(self.filename, workers=workers, chunk_size=chunk_size)
+                self.assertEqual(
+                    [(d["line"], d["kind"]) for d in result],
+                    [(1, "no_transaction"), (4, "rem_in_transaction"), (5, "nested_begin"),
+                     (7, "no_transaction"), (8, "unclosed_transaction")]
+                )
+
+    def test_chunk_rem_events_only_when_needed(self):
+        """Тест: REM попадают в события только до первой команды транзакции и после BEGIN."""
+        lines = ['REM content~"a"', 'COMMIT', 'REM content~"b"', 'BEGIN', 'REM content~"c"']
+        _, events = _check_chunk((10, lines))
+        self.assertEqual(events, [(10, "REM"), (11, "COMMIT"), (13, "BEGIN"), (14, "REM")])
+
+    def test_results_in_order_bounded_window(self):
+        """Тест: пачки читаются по мере проверки, а не все сразу."""
+        read = []
+
+        def chunks():
+            for n in range(10):
+                read.append(n)
+                yield n * 2 + 1, ['PRINT', 'UNKCOMMAND']
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            results = _results_in_order(pool, chunks(), window=2)
+            errors, _ = next(results)
+            self.assertEqual(len(read), 2)
+            lines = [errors[0]["line"]] + [e[0]["line"] for e, _ in results]
+        self.assertEqual(lines, list(range(2, 21, 2)))
+
+    def test_main_check_mode(self):
+        """Тест режима --check: вывод JSON и код возврата."""
+        f = StringIO()
+        with redirect_stdout(f):
+            code = main(["--check", self.filename])
+
+        self.assertEqual(code, 1)
+        self.assertEqual(len(json.loads(f.getvalue())), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+"""Модуль для проверки файла команд без выполнения (режим --check)."""
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
+
+from artifact_io import split_path_format
+from classes import Artifact
+from comand_parser import parse_args
+from command_io import open_commands
+from patterns import compile_pattern
+
+# виды ошибок, которые возвращает проверка
+MISSING_SEMICOLON = "missing_semicolon"
+MISSING_TILDE = "missing_tilde"
+INVALID_REGEX = "invalid_regex"
+INVALID_EXPORT = "invalid_export"
+UNKNOWN_TYPE = "unknown_type"
+MISSING_PARAM = "missing_param"
+UNKNOWN_COMMAND = "unknown_command"
+NESTED_BEGIN = "nested_begin"
+NO_TRANSACTION = "no_transaction"
+REM_IN_TRANSACTION = "rem_in_transaction"
+UNCLOSED_TRANSACTION = "unclosed_transaction"
+
+# команды, порядок которых проверяется после разбора пачек
+TRANSACTION_COMMANDS = ("BEGIN", "COMMIT", "ROLLBACK")
+
+# сколько строк проверяет один воркер за раз
+CHUNK_SIZE = 5000
+
+
+def validate_line(line: str) -> Optional[Dict[str, str]]:
+    """Проверяет одну строку команды, возвращает описание ошибки или None."""
+    line = line.strip()
+    if not line:
+        return None
+
+    #разбор повторяет CommandProcessor.process_line, но ничего не выполняет
+    if line.startswith("ADD"):
+        data = line[4:].strip()
+        if ";" not in data:
+            return {"kind": MISSING_SEMICOLON, "message": data}
+        type_name, args = data.split(";", 1)
+        try:
+            Artifact.create(type_name, **parse_args(args))
+        except KeyError as e:
+            return {"kind": MISSING_PARAM, "message": f"{e.args[0]} ({type_name})"}
+        except ValueError as e:
+            return {"kind": UNKNOWN_TYPE, "message": str(e)}
+        return None
+
+    if line.startswith("REM"):
+        data = line[4:].strip()
+        if "~" not in data:
+            return {"kind": MISSING_TILDE, "message": data}
+        value = data.split("~", 1)[1].strip()
+        if len(value) >= 2 and value.startswith("/") and value.endswith("/"):
+            try:
+                compile_pattern(value[1:-1])
+            except re.error as e:
+                return {"kind": INVALID_REGEX, "message": f"{value}: {e}"}
+        return None
+
+    if line.startswith(("EXPORT", "IMPORT")):
+        try:
+            split_path_format(line[7:].strip())
+        except ValueError as e:
+            return {"kind": INVALID_EXPORT, "message": str(e)}
+        return None
+
+    if line.startswith("MEMSTATS"):
+        data = line[8:].strip()
+        if data and not data.isdigit():
+            return {"kind": UNKNOWN_COMMAND, "message": line}
+        return None
+
+    if line in ("PRINT", "BEGIN", "COMMIT", "ROLLBACK"):
+        return None
+
+    return {"kind": UNKNOWN_COMMAND, "message": line}
+
+
+def _check_chunk(chunk: Tuple[int, List[str]]) -> Tuple[List[Dict], List[Tuple[int, str]]]:
+    """Проверяет пачку строк, начинающуюся со строки с номером start.
+
+    Кроме ошибок возвращает (номер строки, команда) для BEGIN/COMMIT/ROLLBACK
+    и для REM, которые могут оказаться внутри транзакции: до первой команды
+    транзакции в пачке (состояние на ее начале неизвестно) и после BEGIN.
+    """
+    start, lines = chunk
+    result = []
+    events = []
+    #None - до первой команды транзакции в пачке неизвестно, открыта ли она
+    in_transaction: Optional[bool] = None
+    for offset, line in enumerate(lines):
+        error = validate_line(line)
+        if error is not None:
+            error["line"] = start + offset
+            result.append(error)
+            continue
+        line = line.strip()
+        if line in TRANSACTION_COMMANDS:
+            events.append((start + offset, line))
+            #после любой из этих команд состояние известно, даже если она ошибочна
+            in_transaction = line == "BEGIN"
+        elif line.startswith("REM") and in_transaction is not False:
+            events.append((start + offset, "REM"))
+    return result, events
+
+
+def _check_transactions(events: List[Tuple[int, str]],
+                        begin_line: Optional[int] = None) -> Tuple[List[Dict], Optional[int]]:
+    """Проверяет порядок команд транзакций, как при выполнении.
+
+    begin_line - строка BEGIN транзакции, открытой до этих событий (или None).
+    Возвращает ошибки и строку BEGIN транзакции, оставшейся открытой.
+    """
+    result = []
+    for line, command in events:
+        if command == "BEGIN":
+            if begin_line is not None:
+                result.append({"kind": NESTED_BEGIN, "message": "транзакция уже открыта",
+                               "line": line})
+            else:
+                begin_line = line
+        elif command == "REM":
+            if begin_line is not None:
+                result.append({"kind": REM_IN_TRANSACTION,
+                               "message": "REM внутри транзакции не поддерживается",
+                               "line": line})
+        elif begin_line is None:
+            result.append({"kind": NO_TRANSACTION, "message": f"{command} без BEGIN",
+                           "line": line})
+        else:
+            begin_line = None
+    return result, begin_line
+
+
+def _read_chunks(filename: str, chunk_size: int):
+    """Читает файл пачками строк вместе с номером первой строки пачки."""
+    with open_commands(filename) as f:
+        start = 1
+        lines = []
+        for line in f:
+            lines.append(line)
+            if len(lines) == chunk_size:
+                yield start, lines
+                start += len(lines)
+                lines = []
+        if lines:
+            yield start, lines
+
+
+def _results_in_order(pool: ProcessPoolExecutor, chunks, window: int):
+    """Отдает результаты _check_chunk по порядку, держа в работе не больше window пачек.
+
+    Файл читается по мере проверки, а не целиком до получения первого результата.
+    """
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(_check_chunk, chunk))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def check_file(filename: str, workers: Optional[int] = None,
+               chunk_size: int = CHUNK_SIZE) -> List[Dict]:
+    """Проверяет файл команд и возвращает список ошибок по порядку строк.
+
+    Пачки строк проверяются параллельно в отдельных процессах, в работе
+    одновременно не больше двух пачек на процесс; если пачка всего одна,
+    проверка идёт в текущем процессе. Порядок BEGIN/COMMIT/ROLLBACK
+    проверяется по мере получения результатов пачек.
+    """
+    chunks = _read_chunks(filename, chunk_size)
+    first = next(chunks, None)
+    if first is None:
+        return []
+    second = next(chunks, None)
+    chunks = chain([first], [second] if second else [], chunks)
+
+    diagnostics = []
+    begin_line = None
+    with ExitStack() as stack:
+        if second is None or workers == 1:
+            results = map(_check_chunk, chunks)
+        else:
+            workers = workers or os.cpu_count() or 1
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            results = _results_in_order(pool, chunks, 2 * workers)
+        for errors, events in results:
+            diagnostics.extend(errors)
+            errors, begin_line = _check_transactions(events, begin_line)
+            diagnostics.extend(errors)
+
+    if begin_line is not None:
+        diagnostics.append({"kind": UNCLOSED_TRANSACTION,
+                            "message": "файл закончился без COMMIT", "line": begin_line})
+    diagnostics.sort(key=lambda d: d["line"])
+    return diagnostics
+
+
+def check_file_json(filename: str, workers: Optional[int] = None) -> str:
+    """Возвращает результат check_file в виде JSON."""
+    return json.dumps(check_file(filename, workers), ensure_ascii=False)